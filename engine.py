@@ -75,3 +75,32 @@ class IteratedPrisonersDilemma:
             total_score2 += score2
 
         return total_score1, total_score2, history1, history2
+
+    def play_self_match(self, strategy: Callable) -> Tuple[int, int, History, History]:
+        """
+        Plays a deterministic strategy against itself without noise.
+
+        Both sides see the same histories and make the same move every round,
+        so the strategy is evaluated once per round and the result mirrored.
+        Consumes the same random draws as play_match.
+        """
+        history: History = []
+        total_score = 0
+
+        for _ in range(self.rounds):
+            move = strategy(history, history)
+            self.skip_rounds(1)
+
+            history.append(move)
+            total_score += self.payoff_matrix[(move, move)][0]
+
+        return total_score, total_score, history, list(history)
+
+    def skip_rounds(self, rounds: int):
+        """
+        Advances the random stream by the noise draws of `rounds` rounds
+        between deterministic strategies, so a match whose result is reused
+        leaves later matches unchanged.
+        """
+        for _ in range(2 * rounds):
+            random.random()
@@ -1,9 +1,15 @@
+import os
+import time
 import random
+import asyncio
 import numpy as np
 import matplotlib.pyplot as plt
 import multiprocessing as mp
+from concurrent.futures import ProcessPoolExecutor
 
 from tournament import Tournament
+from results_store import ResultsStore, make_run_id
+from progress import ProgressTracker
 
 
 # ============================
@@ -16,6 +22,11 @@ NOISE_START = 0.0
 NOISE_END = 0.5
 NOISE_STEP = 0.05
 NUM_PROCESSES = mp.cpu_count()
+RESULTS_DIR = "results"
+PROGRESS_DIR = "progress"
+PROGRESS_INTERVAL = 5.0  # seconds between live summary updates
+CI_TARGET = None  # stop a noise level once every 95% CI is below this
+MIN_SEEDS = 10  # seeds required before CI_TARGET is checked
 
 # ============================
 
@@ -45,7 +56,20 @@ def run_single_experiment(args):
         seed=seed,
     )
 
-    results, _ = tournament.run_round_robin()
+    results, match_data = tournament.run_round_robin()
+
+    rows = [
+        {
+            "player1": match["player1"],
+            "player2": match["player2"],
+            "noise": noise,
+            "seed": seed,
+            "rounds": ROUNDS,
+            "score1": match["score1"],
+            "score2": match["score2"],
+        }
+        for match in match_data
+    ]
 
     num_strategies = len(tournament.strategies)
     total_rounds_per_strategy = num_strategies * ROUNDS
@@ -55,10 +79,137 @@ def run_single_experiment(args):
         for name, score in results.items()
     }
 
-    return noise, averages
-
+    return noise, averages, rows
+
+
+def run_timed_experiment(args):
+    """Worker wrapper reporting which process ran the cell and when."""
+    started = time.time()
+    result = run_single_experiment(args)
+    return os.getpid(), started, time.time(), result
+
+
+async def run_cells_async(tasks, tracker, results, store=None, run_id=None):
+    """
+    Dispatches cells to the process pool and consumes them as they finish.
+
+    Completed cells are appended to results as (noise, averages) as they
+    arrive, so the caller keeps them even if the sweep fails or is
+    interrupted. If a store is given, their match rows are written to it as
+    a new chunk at most every PROGRESS_INTERVAL seconds and on exit, so a
+    killed sweep only loses its latest cells. The event loop
+    only waits on completed futures, so updating the live summary never
+    stalls the workers. Pending cells are cancelled when a STOP file
+    appears or, with CI_TARGET set, once their noise level has converged.
+    """
+    executor = ProcessPoolExecutor(NUM_PROCESSES)
+    pending = {}
+    cells = {}
+    unstored = []
+    last_flush = time.time()
+
+    def consume(future):
+        worker, started, finished, (noise, averages, rows) = future.result()
+        tracker.record(noise, averages, worker, started, finished)
+        results.append((noise, averages))
+        if store is not None:
+            unstored.extend(rows)
+
+    def flush():
+        nonlocal last_flush
+        last_flush = time.time()
+        if unstored:
+            store.append(unstored, run_id=run_id)
+            unstored.clear()
+
+    try:
+        # Cells are submitted directly so they can be cancelled through
+        # their concurrent.futures future, which refuses once a cell runs.
+        # The asyncio wrappers are only used to wait on them.
+        for task in tasks:
+            cell = executor.submit(run_timed_experiment, task)
+            cells[asyncio.wrap_future(cell)] = cell
+            pending[cell] = task
+
+        while pending:
+            waiting = [future for future, cell in cells.items() if cell in pending]
+            done, _ = await asyncio.wait(waiting, return_when=asyncio.FIRST_COMPLETED)
+
+            # Keep every successful cell of the batch before raising
+            error = None
+            for future in done:
+                del pending[cells.pop(future)]
+                if future.cancelled():
+                    continue
+
+                if future.exception() is not None:
+                    error = error or future.exception()
+                else:
+                    consume(future)
+
+            if error is not None:
+                raise error
+
+            if tracker.stop_requested():
+                print("Stop requested, cancelling remaining cells")
+                stop = list(pending)
+            elif CI_TARGET is not None:
+                # Each noise level is checked once, not once per cell
+                noises = {noise for noise, _ in pending.values()}
+                converged = {
+                    noise for noise in noises
+                    if tracker.converged(noise, CI_TARGET, MIN_SEEDS)
+                }
+                stop = [
+                    cell for cell, (noise, _) in pending.items()
+                    if noise in converged
+                ]
+            else:
+                stop = []
+
+            for cell in stop:
+                if cell.cancel():
+                    tracker.cancelled += 1
+                    del pending[cell]
+
+            if time.time() - last_flush >= PROGRESS_INTERVAL:
+                flush()
+
+            tracker.write()
+            print(
+                f"\r{tracker.completed}/{tracker.total_cells} cells, "
+                f"{tracker.cancelled} cancelled",
+                end="",
+                flush=True,
+            )
 
-def run_experiments_parallel():
+        executor.shutdown(wait=True)
+
+    finally:
+        # On a failed cell or Ctrl-C, drop queued cells instead of
+        # running them all before the error reaches the caller
+        executor.shutdown(wait=False, cancel_futures=True)
+        for future in cells:
+            if not future.done():
+                future.cancel()
+            elif not future.cancelled() and future.exception() is None:
+                # Finished after the last wait; still worth keeping
+                consume(future)
+
+        flush()
+        tracker.write(force=True)
+        print()
+
+
+def run_experiments_parallel(store=None, run_id=None):
+    """
+    Runs every (noise, seed) tournament across the process pool.
+
+    Progress, throughput and running CIs are written to PROGRESS_DIR while
+    the sweep runs. If a ResultsStore is given, every played match is
+    appended to it under run_id while the sweep runs, so it can be reloaded
+    or merged later.
+    """
     noise_values = np.arange(NOISE_START, NOISE_END + NOISE_STEP, NOISE_STEP)
 
     tasks = []
@@ -72,14 +223,30 @@ def run_experiments_parallel():
     print(f"Seeds per noise level: {NUM_SEEDS}")
     print(f"Noise values: {noise_values}")
     print(f"Using {NUM_PROCESSES} processes")
+    if store is not None:
+        run_id = run_id or make_run_id()
+        print(f"Storing results in {store.path} (run {run_id})")
+    print(f"Live progress in {PROGRESS_DIR}/ (create {PROGRESS_DIR}/STOP to stop early)")
     print("-" * 60)
 
-    with mp.Pool(NUM_PROCESSES) as pool:
-        results = pool.map(run_single_experiment, tasks)
-
     temp_tournament = Tournament(rounds=ROUNDS, noise=0.0, seed=1)
     strategy_names = list(temp_tournament.strategies.keys())
 
+    num_strategies = len(strategy_names)
+    num_matches = num_strategies * (num_strategies + 1) // 2
+
+    tracker = ProgressTracker(
+        total_cells=len(tasks),
+        strategy_names=strategy_names,
+        rounds_per_cell=num_matches * ROUNDS,
+        path=PROGRESS_DIR,
+        interval=PROGRESS_INTERVAL,
+        labels=DISPLAY_NAMES,
+    )
+
+    results = []
+    asyncio.run(run_cells_async(tasks, tracker, results, store=store, run_id=run_id))
+
     all_results = {
         name: {noise: [] for noise in noise_values}
         for name in strategy_names
@@ -89,6 +256,12 @@ def run_experiments_parallel():
         for name, avg in averages.items():
             all_results[name][noise].append(avg)
 
+    # Drop noise levels that were stopped before any cell finished
+    noise_values = np.array([
+        noise for noise in noise_values
+        if all_results[strategy_names[0]][noise]
+    ])
+
     return all_results, noise_values, strategy_names
 
 
@@ -202,8 +375,20 @@ def plot_pas_vs_all(summary, noise_values, strategy_names):
     plt.tight_layout()
     plt.show()
 
+
+def load_results(path=RESULTS_DIR, **filters):
+    """
+    Reloads stored sweeps in the format of run_experiments_parallel,
+    e.g. load_results(rounds=ROUNDS) to plot without re-running.
+    Filters select whole tournaments (run_id, noise, seed, rounds).
+    """
+    return ResultsStore(path).to_nested(**filters)
+
+
 if __name__ == "__main__":
-    all_results, noise_vals, names = run_experiments_parallel()
+    all_results, noise_vals, names = run_experiments_parallel(
+        store=ResultsStore(RESULTS_DIR),
+    )
     summary_stats = summarize_results(all_results, noise_vals, names)
     plot_all_strategies(summary_stats, noise_vals, names)
     plot_pas_vs_all(summary_stats, noise_vals, names)
@@ -1,3 +1,6 @@
+from concurrent.futures import ProcessPoolExecutor
+import multiprocessing as mp
+
 from tournament import Tournament
 from openpyxl import Workbook
 from openpyxl.styles import PatternFill, Alignment
@@ -7,19 +10,24 @@ def main():
     ROUNDS = 10000
     NOISE = 0.2
     SEED = 314232
+    NUM_PROCESSES = mp.cpu_count()
 
     print("Prisoner's Dilemma Tournament")
     print(f"Rounds per match: {ROUNDS}")
     print(f"Noise level: {NOISE}")
+    print(f"Using {NUM_PROCESSES} processes")
     print("-" * 50)
 
-    tournament = Tournament(
-        rounds=ROUNDS,
-        noise=NOISE,
-        seed=SEED,
-    )
+    # Matches are played concurrently, one seed per pairing
+    with ProcessPoolExecutor(NUM_PROCESSES) as executor:
+        tournament = Tournament(
+            rounds=ROUNDS,
+            noise=NOISE,
+            seed=SEED,
+            executor=executor,
+        )
 
-    results, match_data = tournament.run_round_robin()
+        results, match_data = tournament.run_round_robin()
 
     # --- Print ranking by average per round ---
     num_strategies = len(tournament.strategies)
@@ -0,0 +1,145 @@
+import os
+import json
+import time
+from collections import defaultdict
+from typing import Dict, List
+
+import numpy as np
+from matplotlib.figure import Figure
+
+
+PROGRESS_FILE = "progress.json"
+PLOT_FILE = "progress.png"
+STOP_FILE = "STOP"
+
+
+class ProgressTracker:
+    """
+    Live telemetry for a running sweep, fed by the parent as cells complete.
+
+    Writes a JSON summary and a plot of running means with 95% CIs into
+    path, at most once every interval seconds. Creating a file named STOP
+    in path asks the sweep to cancel its remaining cells.
+    """
+
+    def __init__(
+        self,
+        total_cells: int,
+        strategy_names: List[str],
+        rounds_per_cell: int,
+        path: str = "progress",
+        interval: float = 5.0,
+        labels: Dict[str, str] = None,
+    ):
+        self.total_cells = total_cells
+        self.strategy_names = strategy_names
+        self.rounds_per_cell = rounds_per_cell
+        self.path = path
+        self.interval = interval
+        self.labels = labels or {}
+
+        os.makedirs(self.path, exist_ok=True)
+        stop_file = os.path.join(self.path, STOP_FILE)
+        if os.path.exists(stop_file):
+            os.remove(stop_file)
+
+        self.started = time.time()
+        self.last_write = 0.0
+        self.completed = 0
+        self.cancelled = 0
+
+        # Running sums per (name, noise): count, sum, sum of squares
+        self.stats = defaultdict(lambda: np.zeros(3))
+        self.busy = defaultdict(float)
+
+    def record(self, noise, averages: dict, worker: int, started: float, finished: float):
+        self.completed += 1
+        self.busy[worker] += finished - started
+
+        for name, avg in averages.items():
+            self.stats[(name, noise)] += (1, avg, avg * avg)
+
+    def estimate(self, name, noise) -> dict:
+        count, total, sq = self.stats[(name, noise)]
+        if count == 0:
+            return {"count": 0, "mean": None, "ci95": None}
+
+        mean = total / count
+        std = np.sqrt(max(sq / count - mean * mean, 0.0))
+        ci95 = 1.96 * std / np.sqrt(count)
+
+        return {"count": int(count), "mean": float(mean), "ci95": float(ci95)}
+
+    def converged(self, noise, ci_target: float, min_seeds: int) -> bool:
+        """True once every strategy's 95% CI at this noise is below ci_target."""
+        for name in self.strategy_names:
+            est = self.estimate(name, noise)
+            if est["count"] < min_seeds or est["ci95"] > ci_target:
+                return False
+        return True
+
+    def stop_requested(self) -> bool:
+        return os.path.exists(os.path.join(self.path, STOP_FILE))
+
+    def snapshot(self) -> dict:
+        elapsed = time.time() - self.started
+        noises = sorted({noise for _, noise in self.stats})
+
+        return {
+            "completed_cells": self.completed,
+            "cancelled_cells": self.cancelled,
+            "total_cells": self.total_cells,
+            "elapsed_s": elapsed,
+            "rounds_per_s": self.completed * self.rounds_per_cell / elapsed if elapsed else 0.0,
+            "worker_utilization": {
+                str(worker): busy / elapsed if elapsed else 0.0
+                for worker, busy in sorted(self.busy.items())
+            },
+            "estimates": {
+                name: {f"{noise:.4f}": self.estimate(name, noise) for noise in noises}
+                for name in self.strategy_names
+            },
+        }
+
+    def write(self, force: bool = False):
+        """Refreshes the JSON summary and plot, throttled to self.interval."""
+        now = time.time()
+        if not force and now - self.last_write < self.interval:
+            return
+        self.last_write = now
+
+        snapshot = self.snapshot()
+
+        # Write then rename so readers never see a partial file
+        tmp = os.path.join(self.path, PROGRESS_FILE + ".tmp")
+        with open(tmp, "w") as f:
+            json.dump(snapshot, f, indent=2)
+        os.replace(tmp, os.path.join(self.path, PROGRESS_FILE))
+
+        self._plot()
+
+    def _plot(self):
+        # Figure without pyplot: no GUI backend, never blocks
+        fig = Figure(figsize=(12, 8))
+        ax = fig.add_subplot()
+
+        noises = sorted({noise for _, noise in self.stats})
+        for name in self.strategy_names:
+            est = [self.estimate(name, noise) for noise in noises]
+            xs = [noise for noise, e in zip(noises, est) if e["count"]]
+            means = np.array([e["mean"] for e in est if e["count"]])
+            ci = np.array([e["ci95"] for e in est if e["count"]])
+
+            ax.plot(xs, means, label=self.labels.get(name, name), linewidth=2)
+            ax.fill_between(xs, means - ci, means + ci, alpha=0.15)
+
+        ax.set_xlabel("Noise Level")
+        ax.set_ylabel("Average Payoff per Round")
+        ax.set_title(f"Live Progress: {self.completed}/{self.total_cells} cells")
+        ax.legend(fontsize=8)
+        ax.grid(True)
+        fig.tight_layout()
+
+        tmp = os.path.join(self.path, "progress.tmp.png")
+        fig.savefig(tmp)
+        os.replace(tmp, os.path.join(self.path, PLOT_FILE))
@@ -0,0 +1,301 @@
+import os
+import json
+import time
+import shutil
+import socket
+from collections import Counter
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+
+# One row per played match. Every column is stored as its own .npy file so
+# that a chunk can be opened with np.load(mmap_mode="r") without copying.
+# String columns are sized per chunk from the data, so nothing is truncated.
+COLUMNS = {
+    "run_id": "U",
+    "player1": "U",
+    "player2": "U",
+    "noise": "<f8",
+    "seed": "<i8",
+    "rounds": "<i8",
+    "score1": "<i8",
+    "score2": "<i8",
+}
+
+# Noise values come from np.arange and carry float drift (0.15000000000000002).
+# Rounding on write keeps keys identical across machines and runs.
+NOISE_DECIMALS = 10
+
+CHUNK_META = "chunk.json"
+
+# Columns identifying one tournament. Per-strategy averages need every match
+# of a tournament, so they can only be filtered on these.
+TOURNAMENT_COLUMNS = ("run_id", "noise", "seed", "rounds")
+
+
+def make_run_id() -> str:
+    """Unique, human readable identifier for one sweep on one machine."""
+    return f"{socket.gethostname()}-{time.strftime('%Y%m%dT%H%M%S')}-{os.getpid()}"
+
+
+class ResultsStore:
+    """
+    Append-only, columnar store of match results.
+
+    Layout on disk:
+        <path>/<chunk name>/<column>.npy
+        <path>/<chunk name>/chunk.json
+
+    Chunks are never modified once written. Merging sweeps from another
+    machine copies over the chunks that are not present yet.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        os.makedirs(self.path, exist_ok=True)
+        self._chunk_columns = None
+
+    # ----------------------------
+    # Writing
+    # ----------------------------
+
+    def append(self, rows: Iterable[dict], run_id: str) -> Optional[str]:
+        """
+        Writes rows as a new chunk and returns its name.
+        Returns None without writing anything if rows is empty.
+
+        Each row needs the keys player1, player2, noise, seed, rounds,
+        score1 and score2. run_id is filled in for every row.
+        """
+        rows = list(rows)
+        if not rows:
+            return None
+
+        data = {name: [] for name in COLUMNS}
+        for row in rows:
+            for name in COLUMNS:
+                data[name].append(run_id if name == "run_id" else row[name])
+
+        data["noise"] = np.round(np.asarray(data["noise"], dtype=float), NOISE_DECIMALS)
+
+        index = sum(1 for name in self.chunks() if name.startswith(run_id + "."))
+        chunk = f"{run_id}.{index:06d}"
+        tmp_dir = os.path.join(self.path, f".tmp-{chunk}")
+        os.makedirs(tmp_dir, exist_ok=True)
+
+        for name, dtype in COLUMNS.items():
+            np.save(os.path.join(tmp_dir, f"{name}.npy"), np.asarray(data[name], dtype=dtype))
+
+        with open(os.path.join(tmp_dir, CHUNK_META), "w") as f:
+            json.dump({"run_id": run_id, "rows": len(rows)}, f)
+
+        # Rename last so readers never see a half-written chunk
+        os.rename(tmp_dir, os.path.join(self.path, chunk))
+        self._chunk_columns = None
+
+        return chunk
+
+    def merge(self, other_path: str) -> List[str]:
+        """
+        Copies every chunk of the store at other_path that is missing here.
+        Returns the names of the copied chunks.
+        """
+        copied = []
+        existing = set(self.chunks())
+
+        for chunk in ResultsStore(other_path).chunks():
+            if chunk in existing:
+                continue
+            # Copy then rename, as in append, so an interrupted merge never
+            # leaves a partial chunk behind
+            tmp_dir = os.path.join(self.path, f".tmp-{chunk}")
+            if os.path.exists(tmp_dir):
+                shutil.rmtree(tmp_dir)
+            shutil.copytree(os.path.join(other_path, chunk), tmp_dir)
+            os.rename(tmp_dir, os.path.join(self.path, chunk))
+            copied.append(chunk)
+
+        if copied:
+            self._chunk_columns = None
+
+        return copied
+
+    # ----------------------------
+    # Reading
+    # ----------------------------
+
+    def chunks(self) -> List[str]:
+        return sorted(
+            name for name in os.listdir(self.path)
+            if not name.startswith(".")
+            and os.path.isfile(os.path.join(self.path, name, CHUNK_META))
+        )
+
+    def chunk_columns(self) -> List[Dict[str, np.ndarray]]:
+        """Memory-mapped column arrays of every chunk; nothing is read yet."""
+        if self._chunk_columns is None:
+            self._chunk_columns = [
+                {
+                    name: np.load(os.path.join(self.path, chunk, f"{name}.npy"), mmap_mode="r")
+                    for name in COLUMNS
+                }
+                for chunk in self.chunks()
+            ]
+        return self._chunk_columns
+
+    def columns(self) -> Dict[str, np.ndarray]:
+        """All rows of the store as a dict of in-memory column arrays."""
+        return self.query()
+
+    def __len__(self):
+        return sum(len(columns["seed"]) for columns in self.chunk_columns())
+
+    def query(self, **filters) -> Dict[str, np.ndarray]:
+        """
+        Rows matching every filter, e.g. query(noise=0.1, player1="Emily").
+        A filter value may be a single value or a list of accepted values.
+
+        Filters are evaluated on each memory-mapped chunk, so only the
+        filter columns and the matching rows are read into memory.
+        """
+        for name, value in filters.items():
+            if name not in COLUMNS:
+                raise KeyError(f"Unknown column: {name}")
+
+        parts = {name: [] for name in COLUMNS}
+
+        for columns in self.chunk_columns():
+            mask = np.ones(len(columns["seed"]), dtype=bool)
+
+            for name, value in filters.items():
+                if name == "noise":
+                    value = np.round(value, NOISE_DECIMALS)
+
+                mask &= np.isin(columns[name], np.atleast_1d(value))
+
+            if not mask.any():
+                continue
+
+            for name, column in columns.items():
+                parts[name].append(column[mask])
+
+        return {
+            name: np.concatenate(parts[name]) if parts[name] else np.empty(0, dtype=dtype)
+            for name, dtype in COLUMNS.items()
+        }
+
+    def group_by(
+        self,
+        keys: Tuple[str, ...],
+        value: str,
+        **filters,
+    ) -> Dict[tuple, dict]:
+        """
+        Aggregates one numeric column over groups of key columns.
+        A single key may be given as a plain string.
+
+        Returns:
+            {key tuple: {"mean", "std", "count"}}
+        """
+        if isinstance(keys, str):
+            keys = (keys,)
+
+        rows = self.query(**filters)
+        return _aggregate([rows[k] for k in keys], np.asarray(rows[value], dtype=float))
+
+    def strategy_averages(self, **filters) -> Dict[tuple, float]:
+        """
+        Average payoff per round of every strategy in every tournament.
+
+        A tournament is one (run_id, noise, seed). Self-play is counted once,
+        matching Tournament.run_round_robin. Only TOURNAMENT_COLUMNS may be
+        filtered on.
+
+        Returns:
+            {(name, noise, run_id, seed): average}
+        """
+        _check_tournament_filters(filters)
+
+        rows = self.query(**filters)
+        cross = rows["player1"] != rows["player2"]
+
+        names = np.concatenate([rows["player1"], rows["player2"][cross]])
+        scores = np.concatenate([rows["score1"], rows["score2"][cross]])
+        tournament = [
+            np.concatenate([rows[k], rows[k][cross]])
+            for k in ("noise", "run_id", "seed", "rounds")
+        ]
+
+        totals = _aggregate([names] + tournament, scores.astype(float), sums=True)
+
+        # Number of strategies taking part in each tournament
+        num_strategies = Counter(key[1:] for key in totals)
+
+        return {
+            key[:4]: total / (num_strategies[key[1:]] * key[4])
+            for key, total in totals.items()
+        }
+
+    def to_nested(self, **filters):
+        """
+        Rebuilds the structure returned by run_experiments_parallel:
+
+            all_results[name][noise] -> list of per-seed averages
+
+        so summaries and plots can be produced without re-running.
+        Only TOURNAMENT_COLUMNS may be filtered on.
+
+        Returns:
+            all_results, noise_values, strategy_names
+        """
+        averages = self.strategy_averages(**filters)
+
+        noise_values = np.array(sorted({key[1] for key in averages}))
+        # Self-play rows come first, so this keeps the tournament's order
+        strategy_names = list(dict.fromkeys(self.query(**filters)["player1"].tolist()))
+
+        all_results = {
+            name: {noise: [] for noise in noise_values}
+            for name in strategy_names
+        }
+
+        for (name, noise, _, _), avg in sorted(averages.items()):
+            all_results[name][noise].append(avg)
+
+        return all_results, noise_values, strategy_names
+
+
+def _check_tournament_filters(filters: dict):
+    invalid = sorted(set(filters) - set(TOURNAMENT_COLUMNS))
+    if invalid:
+        raise ValueError(
+            f"Cannot filter strategy averages on {invalid}; "
+            f"only {list(TOURNAMENT_COLUMNS)} select whole tournaments"
+        )
+
+
+def _aggregate(keys: List[np.ndarray], values: np.ndarray, sums: bool = False):
+    """Group-by over parallel key columns using a single np.unique pass."""
+    if len(values) == 0:
+        return {}
+
+    records = np.rec.fromarrays([np.asarray(k) for k in keys])
+    unique, inverse = np.unique(records, return_inverse=True)
+    inverse = inverse.ravel()
+
+    count = np.bincount(inverse, minlength=len(unique))
+    total = np.bincount(inverse, weights=values, minlength=len(unique))
+
+    if sums:
+        return {tuple(u.tolist()): t for u, t in zip(unique, total)}
+
+    mean = total / count
+    sq = np.bincount(inverse, weights=values * values, minlength=len(unique))
+    std = np.sqrt(np.maximum(sq / count - mean * mean, 0.0))
+
+    return {
+        tuple(u.tolist()): {"mean": m, "std": s, "count": int(c)}
+        for u, m, s, c in zip(unique, mean, std, count)
+    }
+
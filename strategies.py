@@ -188,3 +188,16 @@ def emily(history_self, history_opponent, W=50):
         forgive_p *= max(0.0, 1.0 - d_rate)
         return cooperate() if random.random() < forgive_p else defect()
     return cooperate()
+
+# Strategies whose move depends only on the histories. With zero noise, a match
+# between two of them has the same outcome for every seed.
+DETERMINISTIC = {
+    clara,
+    victor,
+    miles,
+    elena,
+    nathan,
+    gabriel,
+    lucas,
+    samuel,
+}
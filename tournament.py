@@ -1,5 +1,7 @@
+import random
 from typing import Dict, Callable, Tuple, List
 from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
 from itertools import combinations
 from openpyxl import Workbook
 from openpyxl.styles import PatternFill, Alignment
@@ -20,13 +22,84 @@ from strategies import (
     iris,
     lucas,
     samuel,
-    emily
+    emily,
+    DETERMINISTIC,
 )
 
 
 Move = str
 History = List[Move]
 
+# Outcomes of seed-independent matches, shared by every tournament in the
+# process: (strategy1, strategy2, rounds, payoffs) -> (score1, score2, history1, history2)
+_SHARED_MATCHES = {}
+
+
+def is_seed_independent(game: IteratedPrisonersDilemma, strat1: Callable, strat2: Callable) -> bool:
+    """True if the match has the same outcome for every seed."""
+    return (
+        game.noise == 0
+        and strat1 in DETERMINISTIC
+        and strat2 in DETERMINISTIC
+    )
+
+
+def play_pairing(
+    game: IteratedPrisonersDilemma,
+    strat1: Callable,
+    strat2: Callable,
+    shared_stream: bool = True,
+):
+    """
+    Plays one pairing of the round robin.
+
+    Seed-independent matches are simulated once per process and reused
+    across seeds; deterministic self-play is mirrored instead of playing
+    both sides.
+
+    shared_stream: the game's random stream is used by later matches, so a
+        reused match still advances it. Pass False for a game seeded for
+        this pairing alone.
+    """
+    if not is_seed_independent(game, strat1, strat2):
+        return game.play_match(strat1, strat2)
+
+    key = (
+        strat1,
+        strat2,
+        game.rounds,
+        tuple(sorted(game.payoff_matrix.items())),
+    )
+
+    if key not in _SHARED_MATCHES:
+        if strat1 is strat2:
+            _SHARED_MATCHES[key] = game.play_self_match(strat1)
+        else:
+            _SHARED_MATCHES[key] = game.play_match(strat1, strat2)
+    elif shared_stream:
+        game.skip_rounds(game.rounds)
+
+    score1, score2, history1, history2 = _SHARED_MATCHES[key]
+    return score1, score2, list(history1), list(history2)
+
+
+def play_seeded_pairing(args):
+    """
+    Executor task: plays one pairing in a fresh game seeded for that pair.
+
+    args: (strategy1, strategy2, payoff_matrix, rounds, noise, seed)
+    """
+    strat1, strat2, payoff_matrix, rounds, noise, seed = args
+
+    game = IteratedPrisonersDilemma(
+        payoff_matrix=payoff_matrix,
+        rounds=rounds,
+        noise=noise,
+        seed=seed,
+    )
+
+    return play_pairing(game, strat1, strat2, shared_stream=False)
+
 
 class Tournament:
     def __init__(
@@ -35,7 +108,16 @@ class Tournament:
         rounds: int = 200,
         noise: float = 0.0,
         seed: int = None,
+        executor: ProcessPoolExecutor = None,
     ):
+        """
+        executor: optional process pool used to play the pairings
+            concurrently. Each pairing then gets its own seed derived from
+            seed and the two names, so results do not depend on the
+            scheduling order (but differ from a serial run with the same seed).
+            The engine and strategies draw from the module-level random,
+            so thread pools are rejected.
+        """
         if strategies is None:
             strategies = {
                 "Clara": clara,
@@ -51,7 +133,16 @@ class Tournament:
                 "Emily": emily
             }
 
+        if executor is not None and not isinstance(executor, ProcessPoolExecutor):
+            raise TypeError(
+                "Tournament executor must be a ProcessPoolExecutor: matches "
+                "reseed the shared module-level random, which is not "
+                "reproducible across threads"
+            )
+
         self.strategies = strategies
+        self.seed = seed
+        self.executor = executor
         self.game = IteratedPrisonersDilemma(
             rounds=rounds,
             noise=noise,
@@ -66,34 +157,37 @@ class Tournament:
 
         names = list(self.strategies.keys())
 
-        # Self-play
-        for name in names:
-            strat = self.strategies[name]
-            score1, score2, history1, history2 = self.game.play_match(strat, strat)
+        # Self-play first, then unique pair matches only
+        pairings = [(name, name) for name in names] + list(combinations(names, 2))
 
-            total_scores[name] += score1  # score1 == score2
-
-            match_results.append({
-                "player1": name,
-                "player2": name,
-                "score1": score1,
-                "score2": score2,
-                "history1": history1,
-                "history2": history2,
-            })
-
-        # Unique pair matches only
-        for name1, name2 in combinations(names, 2):
-            strat1 = self.strategies[name1]
-            strat2 = self.strategies[name2]
-
-            score1, score2, history1, history2 = self.game.play_match(
-                strat1,
-                strat2,
+        if self.executor is None:
+            outcomes = (
+                play_pairing(self.game, self.strategies[name1], self.strategies[name2])
+                for name1, name2 in pairings
+            )
+        else:
+            # Executor.map yields in submission order
+            outcomes = self.executor.map(
+                play_seeded_pairing,
+                [
+                    (
+                        self.strategies[name1],
+                        self.strategies[name2],
+                        self.game.payoff_matrix,
+                        self.game.rounds,
+                        self.game.noise,
+                        self.pair_seed(name1, name2),
+                    )
+                    for name1, name2 in pairings
+                ],
             )
 
+        for (name1, name2), outcome in zip(pairings, outcomes):
+            score1, score2, history1, history2 = outcome
+
             total_scores[name1] += score1
-            total_scores[name2] += score2
+            if name1 != name2:
+                total_scores[name2] += score2  # self-play: score1 == score2
 
             match_results.append({
                 "player1": name1,
@@ -109,6 +203,12 @@ class Tournament:
 
         return self.results, self.match_data
 
+    def pair_seed(self, name1: str, name2: str) -> int:
+        """Seed for one pairing, stable across processes and scheduling order."""
+        if self.seed is None:
+            return None
+        return random.Random(f"{self.seed}:{name1}:{name2}").getrandbits(32)
+
     def ranked_results(self):
         if not self.results:
             self.run_round_robin()